@@ -244,8 +244,8 @@ class SpeedCtrl:
         self.tau_L = self.tau_i - (self.k_p - self.k_t)*w_M
         tau_M_ref = self.k_t*(w_M_ref - w_M) + self.tau_L
 
-        if np.abs(tau_M_ref) > self.tau_M_max:
-            tau_M_ref = np.sign(tau_M_ref)*self.tau_M_max
+        # Saturation
+        tau_M_ref = min(max(tau_M_ref, -self.tau_M_max), self.tau_M_max)
 
         return tau_M_ref
 
@@ -317,6 +317,78 @@ class RateLimiter:
         return y
 
 
+# %%
+class PreallocLogger:
+    """
+    Data logger writing into preallocated arrays.
+
+    The signals are written by the sample index into typed ndarrays, which
+    avoids creating a new data object at every sampling period. The arrays are
+    doubled in length if they become full, so the number of samples need not
+    be known in advance.
+
+    Parameters
+    ----------
+    dtypes : dict
+        Data types of the logged signals, keyed by the signal names. The
+        values given to the `write` method follow this order.
+    N : int, optional
+        Initial length of the arrays. The default is 2**14.
+
+    """
+
+    def __init__(self, dtypes, N=2**14):
+        self.keys = tuple(dtypes)
+        self._arrays = [np.empty(N, dtype=dtype) for dtype in dtypes.values()]
+        self._length = 0
+
+    def write(self, idx, *values):
+        """
+        Write the signal values of a single sample.
+
+        Parameters
+        ----------
+        idx : int
+            Sample index.
+        *values : float or complex
+            Signal values in the order of `keys`.
+
+        Raises
+        ------
+        ValueError
+            If the number of values differs from the number of signals.
+
+        """
+        if len(values) != len(self.keys):
+            raise ValueError(
+                f'Expected {len(self.keys)} values, got {len(values)}.')
+        if idx >= len(self._arrays[0]):
+            self._arrays = [
+                np.concatenate((array, np.empty_like(array)))
+                for array in self._arrays
+            ]
+        for array, value in zip(self._arrays, values):
+            array[idx] = value
+        self._length = max(self._length, idx + 1)
+
+    def to_bunch(self):
+        """
+        Return the logged data.
+
+        Returns
+        -------
+        Bunch
+            Copies of the logged signals as ndarrays of the written length.
+            Modifying them does not affect the logger.
+
+        """
+        return Bunch(
+            **{
+                key: array[:self._length].copy()
+                for key, array in zip(self.keys, self._arrays)
+            })
+
+
 # %%
 class Ctrl:
     """Base class for main control loops."""
@@ -22,10 +22,12 @@ References
 """
 from typing import Callable
 from dataclasses import dataclass, field
+import cmath
+import math
 import numpy as np
 
-from motulator.helpers import abc2complex, Bunch
-from motulator.control.common import Ctrl, SpeedCtrl, PWM
+from motulator.helpers import abc2complex
+from motulator.control.common import Ctrl, SpeedCtrl, PWM, PreallocLogger
 from motulator.control.sm_vector import SensorlessObserver
 from motulator.control.sm_obs_vhz import FluxTorqueRef
 
@@ -67,6 +69,11 @@ class SynchronousMotorFluxVectorCtrlPars:
     zeta_inf: float = .2
     # Sensored observer (used only in the sensored mode)
     g: float = 2*np.pi*15
+    # Discretization of the sensored observer: 'euler' or 'exact'
+    observer_discretization: str = 'euler'
+    # Storage type of the logged data (the control always runs in double
+    # precision), e.g., np.float32 halves the memory of the logged signals
+    log_dtype: type = np.float64
 
 
 # %%
@@ -99,6 +106,24 @@ class SynchronousMotorFluxVectorCtrl(Ctrl):
         else:
             self.observer = Observer(pars)
         self.flux_torque_ref = FluxTorqueRef(pars)
+        # Data logger and the sample index. The control computations are
+        # always in double precision, and the time is logged in double
+        # precision in order to keep the sampling instants exact.
+        f_type = pars.log_dtype
+        c_type = np.promote_types(pars.log_dtype, np.complex64)
+        self.logger = PreallocLogger({
+            't': np.float64,
+            'i_s': c_type,
+            'psi_s': c_type,
+            'psi_s_ref': f_type,
+            'tau_M_ref_lim': f_type,
+            'theta_m': f_type,
+            'u_dc': f_type,
+            'u_s': c_type,
+            'w_m': f_type,
+            'w_m_ref': f_type,
+        })
+        self._step = 0
 
     def __call__(self, mdl):
         """
@@ -133,11 +158,13 @@ class SynchronousMotorFluxVectorCtrl(Ctrl):
             # Measure the rotor speed
             w_m = self.p*mdl.mech.meas_speed()
             # Limit the electrical rotor position into [-pi, pi)
-            theta_m = np.mod(
-                self.p*mdl.mech.meas_position() + np.pi, 2*np.pi) - np.pi
+            theta_m = self.p*mdl.mech.meas_position()
+            theta_m = (theta_m + math.pi) % (2*math.pi) - math.pi
 
-        # Current vector in estimated rotor coordinates
-        i_s = np.exp(-1j*theta_m)*abc2complex(i_s_abc)
+        # Current vector in estimated rotor coordinates, exp(-1j*theta_m)
+        # is evaluated with scalar math instead of the NumPy ufunc
+        rot = complex(math.cos(theta_m), -math.sin(theta_m))
+        i_s = rot*abc2complex(i_s_abc)
 
         # Flux and torque estimates
         psi_s = self.observer.psi_s
@@ -150,28 +177,30 @@ class SynchronousMotorFluxVectorCtrl(Ctrl):
         d_abc_ref, u_s_ref_lim = self.pwm.output(u_s_ref, u_dc, theta_m, w_m)
 
         # Data logging
-        data = Bunch(
-            i_s=i_s,
-            psi_s=psi_s,
-            psi_s_ref=psi_s_ref,
-            t=self.t,
-            tau_M_ref_lim=tau_M_ref_lim,
-            theta_m=theta_m,
-            u_dc=u_dc,
-            u_s=u_s,
-            w_m=w_m,
-            w_m_ref=w_m_ref,
-        )
-        self.save(data)
+        self.logger.write(
+            self._step, self.t, i_s, psi_s, psi_s_ref, tau_M_ref_lim, theta_m,
+            u_dc, u_s, w_m, w_m_ref)
 
         # Update states
         self.observer.update(u_s, i_s, w_m)
         self.speed_ctrl.update(tau_M_ref_lim)
         self.pwm.update(u_s_ref_lim)
         self.update_clock(self.T_s)
+        self._step += 1
 
         return self.T_s, d_abc_ref
 
+    def post_process(self):
+        """
+        Get the logged data as ndarrays.
+
+        The data is written into the logger during the simulation. Unlike
+        in the other controllers, `data` remains empty until this method is
+        called.
+
+        """
+        self.data = self.logger.to_bunch()
+
 
 # %%
 class FluxTorqueCtrl:
@@ -189,7 +218,6 @@ class FluxTorqueCtrl:
     def __init__(self, pars):
         self.T_s = pars.T_s
         self.R_s = pars.R_s
-        self.p = pars.p
         self.alpha_psi = pars.alpha_psi
         # Gain k_tau
         G = (pars.L_d - pars.L_q)/(pars.L_d*pars.L_q)
@@ -199,6 +227,8 @@ class FluxTorqueCtrl:
         else:  # SyRM
             c_delta0 = 1.5*pars.p*G*psi_s0**2
         self.k_tau = pars.alpha_tau/c_delta0
+        # Constant factor of the torque estimate
+        self._k_tau_M = 1.5*pars.p
 
     def __call__(self, psi_s_ref, tau_M_ref, psi_s, i_s, w_m):
         """
@@ -223,18 +253,26 @@ class FluxTorqueCtrl:
             Unlimited voltage reference.
 
         """
-        # Torque estimate
-        tau_M = 1.5*self.p*np.imag(i_s*np.conj(psi_s))
+        # The signals are scalars, so the math module is used instead of NumPy
+        # in order to avoid the ufunc overhead at every sampling period.
+        # The components are read into local variables once.
+        psi_sd, psi_sq = psi_s.real, psi_s.imag
+        i_sd, i_sq = i_s.real, i_s.imag
+
+        # Torque estimate, Im{i_s*conj(psi_s)} written out
+        tau_M = self._k_tau_M*(i_sq*psi_sd - i_sd*psi_sq)
 
         # Stator frequency
         w_s = w_m + self.k_tau*(tau_M_ref - tau_M)
 
+        # Unit vector in the direction of the flux, equal to exp(1j*delta)
+        abs_psi_s = math.hypot(psi_sd, psi_sq)
+        unit_psi_s = psi_s/abs_psi_s if abs_psi_s > 0 else 1
+
         # Voltage reference
-        e_psi = psi_s_ref - np.abs(psi_s)
-        delta = np.angle(psi_s)
+        e_psi = psi_s_ref - abs_psi_s
         u_s_ref = (
-            self.R_s*i_s + 1j*w_s*psi_s +
-            self.alpha_psi*e_psi*np.exp(1j*delta))
+            self.R_s*i_s + 1j*w_s*psi_s + self.alpha_psi*e_psi*unit_psi_s)
 
         return u_s_ref
 
@@ -244,6 +282,12 @@ class Observer:
     """
     Sensored observer.
 
+    The observer can be discretized using the forward Euler method (default)
+    or exactly, assuming that the inputs are constant over the sampling
+    period. The exact discretization remains stable and accurate also at high
+    speeds relative to the sampling frequency, allowing longer sampling
+    periods to be used.
+
     Parameters
     ----------
     pars : SynchronousMotoroFluxVectorCtrlPars
@@ -259,6 +303,14 @@ class Observer:
         self.L_q = pars.L_q
         self.psi_f = pars.psi_f
         self.g = pars.g
+        # Gains multiplied by the sampling period
+        self._T_s_R_s = pars.T_s*pars.R_s
+        self._T_s_g = pars.T_s*pars.g
+        if pars.observer_discretization not in ('euler', 'exact'):
+            raise ValueError(
+                "observer_discretization must be 'euler' or 'exact', got "
+                f"{pars.observer_discretization!r}")
+        self.exact = pars.observer_discretization == 'exact'
         # Initial state
         self.psi_s = pars.psi_f
 
@@ -276,9 +328,26 @@ class Observer:
             Rotor speed (in electrical rad/s).
 
         """
-        # Estimation error
-        e = self.L_d*i_s.real + 1j*self.L_q*i_s.imag + self.psi_f - self.psi_s
+        # Local variables for the quantities used more than once
+        T_s, psi_s = self.T_s, self.psi_s
+
+        # Stator flux from the current model
+        psi_s_i = self.L_d*i_s.real + 1j*self.L_q*i_s.imag + self.psi_f
+
+        if self.exact:
+            # The observer is of the form d(psi_s)/dt = -a*psi_s + b, where
+            # the inputs in b are constant over the sampling period
+            a = self.g + 1j*w_m
+            b = u_s - self.R_s*i_s + self.g*psi_s_i
+            if a != 0:
+                exp_aT = cmath.exp(-a*T_s)
+                self.psi_s = exp_aT*psi_s + (1 - exp_aT)/a*b
+            else:
+                self.psi_s = psi_s + T_s*b
+        else:
+            # Estimation error
+            e = psi_s_i - psi_s
 
-        # Update the state
-        self.psi_s += self.T_s*(
-            u_s - self.R_s*i_s - 1j*w_m*self.psi_s + self.g*e)
+            # Update the state
+            self.psi_s += (
+                T_s*u_s - self._T_s_R_s*i_s - 1j*T_s*w_m*psi_s + self._T_s_g*e)
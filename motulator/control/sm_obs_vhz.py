@@ -14,6 +14,7 @@ References
 
 from typing import Callable
 from dataclasses import dataclass, field
+import math
 import numpy as np
 
 from motulator.helpers import abc2complex, Bunch
@@ -195,6 +196,20 @@ class FluxTorqueRef:
         # MTPA locus
         mtpa = tq.mtpa_locus(i_s_max=pars.i_s_max)
         self.psi_s_mtpa = mtpa.abs_psi_s_vs_tau_M
+        # Tables of the interpolants above. In the control loop, they are
+        # evaluated with np.interp, which is much faster than calling the
+        # interp1d objects with scalar arguments.
+        self._lim_table = (
+            self.tau_M_lim.x, self.tau_M_lim.y, *self.tau_M_lim.fill_value)
+        self._mtpa_table = (self.psi_s_mtpa.x, self.psi_s_mtpa.y)
+
+    def _interp_psi_s_mtpa(self, abs_tau_M):
+        """Interpolate the MTPA flux, extrapolating above the table."""
+        x, y = self._mtpa_table
+        if abs_tau_M > x[-1]:
+            slope = (y[-1] - y[-2])/(x[-1] - x[-2])
+            return slope*(abs_tau_M - x[-2]) + y[-2]
+        return np.interp(abs_tau_M, x, y)
 
     def __call__(self, tau_M_ref, w_m, u_dc):
         """
@@ -218,20 +233,21 @@ class FluxTorqueRef:
 
         """
         # Get the MTPA flux
-        psi_s_mtpa = self.psi_s_mtpa(np.abs(tau_M_ref))
-        np.clip(psi_s_mtpa, self.psi_s_min, self.psi_s_max, out=psi_s_mtpa)
+        psi_s_mtpa = float(self._interp_psi_s_mtpa(abs(tau_M_ref)))
+        psi_s_mtpa = min(max(psi_s_mtpa, self.psi_s_min), self.psi_s_max)
 
         # Field weakening
-        u_s_max = self.k_u*u_dc/np.sqrt(3)
-        psi_s_max = u_s_max/np.abs(w_m) if np.abs(w_m) > 0 else np.inf
+        u_s_max = self.k_u*u_dc/math.sqrt(3)
+        psi_s_max = u_s_max/abs(w_m) if abs(w_m) > 0 else math.inf
 
         # Flux reference
-        psi_s_ref = np.min([psi_s_max, psi_s_mtpa])
+        psi_s_ref = min(psi_s_max, psi_s_mtpa)
 
         # Limit the torque reference according to the MTPV and current limits
-        tau_M_lim = self.tau_M_lim(psi_s_ref)
-        tau_M_ref_lim = np.min([tau_M_lim, np.abs(tau_M_ref)
-                                ])*np.sign(tau_M_ref)
+        x, y, left, right = self._lim_table
+        tau_M_lim = float(np.interp(psi_s_ref, x, y, left=left, right=right))
+        tau_M_ref_lim = math.copysign(
+            min(tau_M_lim, abs(tau_M_ref)), tau_M_ref)
 
         return psi_s_ref, tau_M_ref_lim
 
@@ -14,12 +14,13 @@ def abc2complex(u):
 
     Parameters
     ----------
-    u : array_like, shape (3,)
-        Phase quantities.
+    u : array_like, shape (3,) or ndarray, shape (3, N)
+        Phase quantities. A two-dimensional array transforms N samples at
+        once, which is faster than calling this function sample by sample.
 
     Returns
     -------
-    complex
+    complex or complex ndarray, shape (N,)
         Complex space vector (peak-value scaling).
 
     Examples
@@ -28,6 +29,10 @@ def abc2complex(u):
     >>> y = abc2complex([1, 2, 3])
     >>> y
     (-1-0.5773502691896258j)
+    >>> import numpy as np
+    >>> y = abc2complex(np.array([[1, 0], [2, 0], [3, 1]]))
+    >>> y
+    array([-1.        -0.57735027j, -0.33333333-0.57735027j])
 
     """
     return (2/3)*u[0] - (u[1] + u[2])/3 + 1j*(u[1] - u[2])/np.sqrt(3)